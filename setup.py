@@ -22,13 +22,14 @@ setup(
         "Topic :: Software Development :: Libraries :: Python Modules",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=requirements,
+    extras_require={
+        "fast": ["orjson>=3.0.0", "msgpack>=1.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "task=taskmanager.cli:cli",
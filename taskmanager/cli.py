@@ -14,7 +14,7 @@ from .filters import FilterPreset, SortField, SortOrder
 from .utils import (
     show_spinner, prompt_date, prompt_tags, show_success, show_error,
     show_warning, show_info, create_header, confirm_action,
-    select_from_list, format_task_summary
+    select_from_list, format_task_summary, parse_iso_date, freeze_now
 )
 from .storage import StorageError
 
@@ -48,6 +48,8 @@ def cli(ctx):
     """
     # Ensure that ctx.obj exists and is a dict
     ctx.ensure_object(dict)
+    # One clock read per command; date helpers reuse this snapshot
+    freeze_now()
 
 
 @cli.command()
@@ -350,7 +352,7 @@ def update(task_id, status, priority, title, description, due_date, add_tag, rem
             updates['description'] = description
         if due_date is not None:
             if due_date:
-                updates['due_date'] = datetime.strptime(due_date, "%Y-%m-%d") if isinstance(due_date, str) else due_date
+                updates['due_date'] = parse_iso_date(due_date) if isinstance(due_date, str) else due_date
             else:
                 updates['due_date'] = None
         
@@ -586,9 +588,9 @@ def clear():
             show_warning("Clear cancelled")
             return
         
-        # Delete tasks with progress
+        # Delete tasks with progress (single save at batch exit)
         deleted_count = 0
-        with console.status("[bold green]Clearing completed tasks...") as status:
+        with task_manager, console.status("[bold green]Clearing completed tasks...") as status:
             for task in done_tasks:
                 task_manager.delete_task(task.id)
                 deleted_count += 1
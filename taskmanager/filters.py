@@ -3,10 +3,20 @@ Advanced filtering and search functionality for tasks.
 """
 
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any, Callable, Union
+from functools import lru_cache
+from typing import Iterable, List, Optional, Dict, Any, Callable, Union
 from enum import Enum
 import re
-from .models import Task, TaskStatus, TaskPriority
+from .models import Task, TaskStatus, TaskPriority, STATUS_BY_VALUE, PRIORITY_BY_VALUE
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int) -> Optional["re.Pattern"]:
+    """Compile (and cache) a search regex; returns None for invalid patterns."""
+    try:
+        return re.compile(pattern, flags)
+    except re.error:
+        return None
 
 
 class SortField(Enum):
@@ -50,14 +60,14 @@ class TaskFilter:
             validated_statuses = []
             for status in statuses:
                 if isinstance(status, str):
-                    try:
-                        validated_statuses.append(TaskStatus(status.lower()))
-                    except ValueError:
+                    resolved = STATUS_BY_VALUE.get(status.lower())
+                    if resolved is None:
                         continue  # Skip invalid statuses
+                    validated_statuses.append(resolved)
                 else:
                     validated_statuses.append(status)
             if validated_statuses:
-                self.criteria['statuses'] = validated_statuses
+                self.criteria['statuses'] = frozenset(validated_statuses)
         return self
     
     def with_priorities(self, priorities: List[Union[str, TaskPriority]]) -> "TaskFilter":
@@ -66,20 +76,20 @@ class TaskFilter:
             validated_priorities = []
             for priority in priorities:
                 if isinstance(priority, str):
-                    try:
-                        validated_priorities.append(TaskPriority(priority.lower()))
-                    except ValueError:
+                    resolved = PRIORITY_BY_VALUE.get(priority.lower())
+                    if resolved is None:
                         continue  # Skip invalid priorities
+                    validated_priorities.append(resolved)
                 else:
                     validated_priorities.append(priority)
             if validated_priorities:
-                self.criteria['priorities'] = validated_priorities
+                self.criteria['priorities'] = frozenset(validated_priorities)
         return self
     
     def with_tags(self, tags: List[str], match_all: bool = False) -> "TaskFilter":
         """Filter by tags (match any or all)."""
         if tags:
-            self.criteria['tags'] = tags
+            self.criteria['tags'] = frozenset(tags)
             self.criteria['tags_match_all'] = match_all
         return self
     
@@ -99,7 +109,7 @@ class TaskFilter:
     def with_search_query(self, query: str, fields: Optional[List[str]] = None) -> "TaskFilter":
         """Full-text search in specified fields (default: title, description)."""
         if query:
-            self.criteria['search_query'] = query.lower()
+            self.criteria['search_query'] = query.casefold()
             self.criteria['search_fields'] = fields or ['title', 'description']
         return self
     
@@ -110,111 +120,157 @@ class TaskFilter:
                 preset = FilterPreset(preset.lower())
             except ValueError:
                 return self
-        
-        if preset == FilterPreset.ACTIVE:
-            self.with_statuses([TaskStatus.TODO, TaskStatus.IN_PROGRESS])
-        elif preset == FilterPreset.OVERDUE:
-            self.criteria['overdue'] = True
-        elif preset == FilterPreset.HIGH_PRIORITY:
-            self.with_priorities([TaskPriority.HIGH, TaskPriority.URGENT])
-        elif preset == FilterPreset.TODAY:
-            today = datetime.now().date()
-            self.with_date_range(today, today)
-        elif preset == FilterPreset.THIS_WEEK:
-            today = datetime.now().date()
-            week_end = today + (6 - today.weekday()) * (datetime.now().date() - today)
-            self.with_date_range(today, week_end)
-        elif preset == FilterPreset.UNTAGGED:
-            self.criteria['untagged'] = True
-        elif preset == FilterPreset.RECENT:
-            week_ago = datetime.now().date() - (datetime.now().date() - datetime.now().date())
-            self.criteria['recent_days'] = 7
-        
+
+        action = _PRESET_ACTIONS.get(preset)
+        if action is not None:
+            action(self)
+
         return self
     
-    def apply(self, tasks: List[Task]) -> List[Task]:
-        """Apply all filter criteria to a list of tasks."""
-        filtered = tasks
-        
-        # Status filter
+    def _build_predicates(self) -> List[Callable[[Task], bool]]:
+        """Compile the registered criteria into a list of predicate closures.
+
+        Each closure binds its criterion values as locals, so the per-task
+        evaluation is one call with locals-only access — no dict lookups
+        into self.criteria inside the loop.
+
+        Predicates are ordered cheapest and most selective first — single
+        hashed membership tests (status, priority), then date comparisons,
+        then tag-set operations, with the substring search last — so
+        apply()'s all() rejects non-matching tasks on the cheapest failing
+        check.
+        """
+        predicates: List[Callable[[Task], bool]] = []
+
         if 'statuses' in self.criteria:
-            filtered = [t for t in filtered if t.status in self.criteria['statuses']]
-        
-        # Priority filter
+            statuses = self.criteria['statuses']
+            predicates.append(lambda t: t.status in statuses)
+
         if 'priorities' in self.criteria:
-            filtered = [t for t in filtered if t.priority in self.criteria['priorities']]
-        
-        # Tags filter
-        if 'tags' in self.criteria:
-            tags = self.criteria['tags']
-            if self.criteria.get('tags_match_all', False):
-                # Match all tags
-                filtered = [t for t in filtered if all(tag in t.tags for tag in tags)]
-            else:
-                # Match any tag
-                filtered = [t for t in filtered if any(tag in t.tags for tag in tags)]
-        
-        # Untagged filter
+            priorities = self.criteria['priorities']
+            predicates.append(lambda t: t.priority in priorities)
+
         if self.criteria.get('untagged'):
-            filtered = [t for t in filtered if not t.tags]
-        
-        # Date range filter
+            predicates.append(lambda t: not t.tags)
+
         if 'date_range' in self.criteria:
             dr = self.criteria['date_range']
             field = dr['field']
             start = dr.get('start')
             end = dr.get('end')
-            
+
             def check_date(task: Task) -> bool:
                 value = getattr(task, field, None)
                 if not value:
                     return False
-                
+
                 # Convert to date if datetime
                 if isinstance(value, datetime):
                     value = value.date()
-                
+
                 if start and value < start:
                     return False
                 if end and value > end:
                     return False
                 return True
-            
-            filtered = [t for t in filtered if check_date(t)]
-        
-        # Overdue filter
+
+            predicates.append(check_date)
+
         if self.criteria.get('overdue'):
             today = datetime.now().date()
-            filtered = [t for t in filtered 
-                       if t.due_date and t.due_date.date() < today 
-                       and t.status != TaskStatus.DONE]
-        
-        # Recent filter
+            predicates.append(lambda t: bool(t.due_date)
+                              and t.due_date.date() < today
+                              and t.status != TaskStatus.DONE)
+
         if 'recent_days' in self.criteria:
             days = self.criteria['recent_days']
-            cutoff = datetime.now() - (datetime.now() - datetime.now())
-            filtered = [t for t in filtered 
-                       if (datetime.now() - t.created_at).days <= days]
-        
-        # Search query
+            now = datetime.now()
+            predicates.append(lambda t: (now - t.created_at).days <= days)
+
+        if 'tags' in self.criteria:
+            tags = self.criteria['tags']
+            if self.criteria.get('tags_match_all', False):
+                # Match all tags (hashed subset check on the cached set)
+                predicates.append(lambda t: tags.issubset(t.tag_set))
+            else:
+                # Match any tag
+                predicates.append(lambda t: not tags.isdisjoint(t.tag_set))
+
         if 'search_query' in self.criteria:
             query = self.criteria['search_query']
             fields = self.criteria['search_fields']
-            
+
             def matches_search(task: Task) -> bool:
                 for field in fields:
                     value = getattr(task, field, '')
-                    if value and query in str(value).lower():
+                    if value and query in str(value).casefold():
                         return True
                 # Also search in tags
                 if 'tags' in fields or not fields:
-                    if any(query in tag.lower() for tag in task.tags):
+                    if any(query in tag.casefold() for tag in task.tags):
                         return True
                 return False
-            
-            filtered = [t for t in filtered if matches_search(t)]
-        
-        return filtered
+
+            predicates.append(matches_search)
+
+        return predicates
+
+    def apply(self, tasks: Iterable[Task]) -> List[Task]:
+        """Apply all filter criteria to an iterable of tasks.
+
+        The criteria are compiled into predicate closures once, then every
+        task makes a single fused pass — no generator frame per criterion.
+        """
+        predicates = self._build_predicates()
+
+        if not predicates:
+            return list(tasks)
+        if len(predicates) == 1:
+            pred = predicates[0]
+            return [t for t in tasks if pred(t)]
+        return [t for t in tasks if all(p(t) for p in predicates)]
+
+
+def _apply_today(f: TaskFilter) -> None:
+    today = datetime.now().date()
+    f.with_date_range(today, today)
+
+
+def _apply_this_week(f: TaskFilter) -> None:
+    today = datetime.now().date()
+    week_end = today + (6 - today.weekday()) * (datetime.now().date() - today)
+    f.with_date_range(today, week_end)
+
+
+# Preset -> criteria installer, dispatched with a single dict probe
+# instead of an if/elif chain over every preset. Date-dependent presets
+# stay callables so the clock is read when the filter is built, never at
+# import time.
+_PRESET_ACTIONS: Dict[FilterPreset, Callable[[TaskFilter], None]] = {
+    FilterPreset.ACTIVE: lambda f: f.with_statuses([TaskStatus.TODO, TaskStatus.IN_PROGRESS]),
+    FilterPreset.OVERDUE: lambda f: f.criteria.update(overdue=True),
+    FilterPreset.HIGH_PRIORITY: lambda f: f.with_priorities([TaskPriority.HIGH, TaskPriority.URGENT]),
+    FilterPreset.TODAY: _apply_today,
+    FilterPreset.THIS_WEEK: _apply_this_week,
+    FilterPreset.UNTAGGED: lambda f: f.criteria.update(untagged=True),
+    FilterPreset.RECENT: lambda f: f.criteria.update(recent_days=7),
+}
+
+
+# Enum member -> ordinal position, precomputed so sort keys avoid
+# rebuilding list(Enum) and scanning it for every task
+_PRIORITY_ORDER = {priority: i for i, priority in enumerate(TaskPriority)}
+_STATUS_ORDER = {status: i for i, status in enumerate(TaskStatus)}
+
+# Sort key extractors, built once at import time
+_SORT_KEYS: Dict[SortField, Callable[[Task], Any]] = {
+    SortField.CREATED_AT: lambda t: t.created_at,
+    SortField.UPDATED_AT: lambda t: t.updated_at,
+    SortField.DUE_DATE: lambda t: (t.due_date or datetime.max, t.created_at),
+    SortField.PRIORITY: lambda t: (_PRIORITY_ORDER[t.priority], t.created_at),
+    SortField.STATUS: lambda t: (_STATUS_ORDER[t.status], t.created_at),
+    SortField.TITLE: lambda t: (t.title.lower(), t.created_at),
+}
 
 
 class TaskSorter:
@@ -250,23 +306,7 @@ class TaskSorter:
             except ValueError:
                 order = SortOrder.ASC
         
-        # Define sort key functions
-        key_funcs: Dict[SortField, Callable[[Task], Any]] = {
-            SortField.CREATED_AT: lambda t: t.created_at,
-            SortField.UPDATED_AT: lambda t: t.updated_at,
-            SortField.DUE_DATE: lambda t: (t.due_date or datetime.max, t.created_at),
-            SortField.PRIORITY: lambda t: (
-                list(TaskPriority).index(t.priority),
-                t.created_at
-            ),
-            SortField.STATUS: lambda t: (
-                list(TaskStatus).index(t.status),
-                t.created_at
-            ),
-            SortField.TITLE: lambda t: (t.title.lower(), t.created_at)
-        }
-        
-        key_func = key_funcs.get(field, lambda t: t.created_at)
+        key_func = _SORT_KEYS.get(field, lambda t: t.created_at)
         reverse = (order == SortOrder.DESC)
         
         return sorted(tasks, key=key_func, reverse=reverse)
@@ -296,23 +336,24 @@ class SearchEngine:
         """
         if not query:
             return tasks
-        
+
         if regex:
-            try:
-                flags = 0 if case_sensitive else re.IGNORECASE
-                pattern = re.compile(query, flags)
-            except re.error:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            pattern = _compile_pattern(query, flags)
+            if pattern is None:
                 return []  # Invalid regex
-            
+
             def matches(text: str) -> bool:
                 return bool(pattern.search(text))
         else:
             if not case_sensitive:
-                query = query.lower()
-            
+                # The common path: one substring check against the task's
+                # cached casefolded blob, no per-field re-folding
+                q = query.casefold()
+                return [task for task in tasks if q in task.search_blob]
+
             def matches(text: str) -> bool:
-                check_text = text if case_sensitive else text.lower()
-                return query in check_text
+                return query in text
         
         results = []
         for task in tasks:
@@ -2,12 +2,25 @@
 Task management logic with full CRUD operations.
 """
 
-from datetime import datetime
-from typing import Dict, List, Optional, Union
-from .models import Task, TaskStatus, TaskPriority
+import atexit
+import bisect
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Union
+from .models import Task, TaskStatus, TaskPriority, STATUS_BY_VALUE, PRIORITY_BY_VALUE
 from .filters import TaskFilter, TaskSorter, SearchEngine, SortField, SortOrder, FilterPreset
 
 
+@lru_cache(maxsize=128)
+def _compile_filter(statuses: tuple, priorities: tuple, tags: tuple) -> TaskFilter:
+    """Build (and cache) a TaskFilter for a hashable criteria tuple."""
+    return (TaskFilter()
+            .with_statuses(list(statuses))
+            .with_priorities(list(priorities))
+            .with_tags(list(tags)))
+
+
 class TaskNotFoundError(Exception):
     """Raised when a task is not found."""
     pass
@@ -23,41 +36,180 @@ class TaskManager:
     Manages task operations (CRUD) with validation and error handling.
     Now with persistent storage support.
     """
-    
+
+    # Prefix lengths kept in the short-ID index; a dict of sliced prefixes
+    # covers the same lookups as a trie without per-node indirection
+    PREFIX_LENGTHS = range(4, 9)
+
+    # Criteria answerable straight from the index buckets
+    _INDEXED_CRITERIA = frozenset({'statuses', 'priorities', 'tags', 'tags_match_all'})
+
     def __init__(self, auto_save: bool = True):
         self.tasks: Dict[str, Task] = {}
         self.auto_save = auto_save
         self._storage = None
-    
-    def _validate_title(self, title: str) -> None:
-        """Validate task title."""
-        if not title or not title.strip():
+        self._dirty = False
+        self._suspend_autosave = 0
+        self._atexit_registered = False
+        # Maps ID prefixes (lengths 4-8) to full IDs for O(1) lookup
+        self._short_index: Dict[str, Optional[str]] = {}
+        # Pre-bucketed ID sets for fast status/priority filtering
+        self._by_status: Dict[TaskStatus, Set[str]] = {s: set() for s in TaskStatus}
+        self._by_priority: Dict[TaskPriority, Set[str]] = {p: set() for p in TaskPriority}
+        # Tag -> IDs of tasks carrying it
+        self._by_tag: Dict[str, Set[str]] = {}
+        # Exact title -> IDs of tasks bearing it
+        self._by_title: Dict[str, Set[str]] = {}
+        # Inverted index: lowercase token -> IDs of tasks containing it
+        self._token_index: Dict[str, Set[str]] = {}
+        # (due_date, ID) pairs kept sorted, so due-date range queries
+        # (overdue above all) bisect to a slice instead of scanning
+        self._due_index: List[tuple] = []
+
+    @staticmethod
+    def _task_tokens(task: Task) -> Set[str]:
+        """Extract the casefolded word tokens of a task's searchable text."""
+        # Stored data may carry null fields; skip them rather than crash
+        parts = [task.title, task.description, task.id, *(task.tags or ())]
+        text = " ".join(p for p in parts if p)
+        return set(re.findall(r"\w+", text.casefold()))
+
+    def _index_task(self, task: Task) -> None:
+        """Register a task in the lookup indexes."""
+        for length in self.PREFIX_LENGTHS:
+            prefix = task.id[:length]
+            # None marks a collision; collided prefixes fall back to scanning
+            existing = self._short_index.get(prefix, task.id)
+            self._short_index[prefix] = task.id if existing == task.id else None
+        self._by_status[task.status].add(task.id)
+        self._by_priority[task.priority].add(task.id)
+        for tag in task.tags:
+            self._by_tag.setdefault(tag, set()).add(task.id)
+        self._by_title.setdefault(task.title, set()).add(task.id)
+        for token in self._task_tokens(task):
+            self._token_index.setdefault(token, set()).add(task.id)
+        if task.due_date is not None:
+            bisect.insort(self._due_index, (task.due_date, task.id))
+
+    def _unindex_task(self, task: Task) -> None:
+        """Remove a task from the lookup indexes."""
+        for length in self.PREFIX_LENGTHS:
+            prefix = task.id[:length]
+            if self._short_index.get(prefix) == task.id:
+                del self._short_index[prefix]
+        self._by_status[task.status].discard(task.id)
+        self._by_priority[task.priority].discard(task.id)
+        for tag in task.tags:
+            ids = self._by_tag.get(tag)
+            if ids is not None:
+                ids.discard(task.id)
+                if not ids:
+                    del self._by_tag[tag]
+        ids = self._by_title.get(task.title)
+        if ids is not None:
+            ids.discard(task.id)
+            if not ids:
+                del self._by_title[task.title]
+        for token in self._task_tokens(task):
+            ids = self._token_index.get(token)
+            if ids is not None:
+                ids.discard(task.id)
+                if not ids:
+                    del self._token_index[token]
+        if task.due_date is not None:
+            entry = (task.due_date, task.id)
+            i = bisect.bisect_left(self._due_index, entry)
+            if i < len(self._due_index) and self._due_index[i] == entry:
+                self._due_index.pop(i)
+
+    def reindex(self) -> None:
+        """Rebuild derived indexes (called after bulk-loading tasks)."""
+        self._short_index.clear()
+        self._by_tag.clear()
+        self._by_title.clear()
+        self._token_index.clear()
+        self._due_index.clear()
+        for bucket in self._by_status.values():
+            bucket.clear()
+        for bucket in self._by_priority.values():
+            bucket.clear()
+        for task in self.tasks.values():
+            self._index_task(task)
+
+    def _bucket_candidates(self, criteria: dict) -> Optional[Set[str]]:
+        """Intersect the index buckets for the indexed criteria.
+
+        Returns the set of candidate IDs, or None when the criteria contain
+        no indexed dimension (meaning every task is a candidate). Tasks
+        outside the returned set can never match, so callers may restrict
+        any further filtering to it.
+        """
+        candidates: Optional[Set[str]] = None
+        if 'statuses' in criteria:
+            candidates = set().union(
+                *(self._by_status[s] for s in criteria['statuses'])
+            )
+        if 'priorities' in criteria:
+            by_priority = set().union(
+                *(self._by_priority[p] for p in criteria['priorities'])
+            )
+            candidates = by_priority if candidates is None else candidates & by_priority
+        if 'tags' in criteria:
+            buckets = [self._by_tag.get(tag, set()) for tag in criteria['tags']]
+            if criteria.get('tags_match_all', False):
+                by_tag = set.intersection(*map(set, buckets)) if buckets else set()
+            else:
+                by_tag = set().union(*buckets)
+            candidates = by_tag if candidates is None else candidates & by_tag
+        return candidates
+
+    def _overdue_candidates(self) -> List[Task]:
+        """Tasks due before today and not done, via the sorted due index.
+
+        Bisecting the index costs O(log n) plus the overdue count, instead
+        of comparing every task's due date against the clock.
+        """
+        cutoff = datetime.combine(datetime.now().date(), datetime.min.time())
+        end = bisect.bisect_left(self._due_index, (cutoff,))
+        done = self._by_status[TaskStatus.DONE]
+        return [self.tasks[tid] for _, tid in self._due_index[:end] if tid not in done]
+
+    def _validate_title(self, title: str) -> str:
+        """Validate task title and return it stripped."""
+        stripped = title.strip() if title else ""
+        if not stripped:
             raise TaskValidationError("Task title cannot be empty")
         if len(title) > 200:
             raise TaskValidationError("Task title cannot exceed 200 characters")
+        return stripped
+
+    @staticmethod
+    def _clean_tags(tags: List[str]) -> List[str]:
+        """Strip tags and drop empties in a single pass."""
+        return [tag for tag in (t.strip() for t in tags) if tag]
     
     def _validate_priority(self, priority: Union[str, TaskPriority]) -> TaskPriority:
         """Validate and convert priority."""
         if isinstance(priority, str):
-            try:
-                return TaskPriority(priority.lower())
-            except ValueError:
+            resolved = PRIORITY_BY_VALUE.get(priority.lower())
+            if resolved is None:
                 valid_priorities = [p.value for p in TaskPriority]
                 raise TaskValidationError(
                     f"Invalid priority '{priority}'. Must be one of: {', '.join(valid_priorities)}"
                 )
+            return resolved
         return priority
     
     def _validate_status(self, status: Union[str, TaskStatus]) -> TaskStatus:
         """Validate and convert status."""
         if isinstance(status, str):
-            try:
-                return TaskStatus(status.lower())
-            except ValueError:
+            resolved = STATUS_BY_VALUE.get(status.lower())
+            if resolved is None:
                 valid_statuses = [s.value for s in TaskStatus]
                 raise TaskValidationError(
                     f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
                 )
+            return resolved
         return status
     
     def _find_task(self, task_id: str) -> Task:
@@ -65,12 +217,17 @@ class TaskManager:
         # Try exact match first
         if task_id in self.tasks:
             return self.tasks[task_id]
-        
-        # Try short ID match
+
+        # Try the short-ID index (single hash probe for prefixes of 4-8 chars)
+        full_id = self._short_index.get(task_id)
+        if full_id is not None and full_id in self.tasks:
+            return self.tasks[full_id]
+
+        # Fall back to a prefix scan (unindexed lengths, collisions)
         for tid, task in self.tasks.items():
             if tid.startswith(task_id):
                 return task
-        
+
         raise TaskNotFoundError(f"Task with ID '{task_id}' not found")
     
     def create_task(self, 
@@ -97,16 +254,16 @@ class TaskManager:
         Raises:
             TaskValidationError: If validation fails
         """
-        self._validate_title(title)
+        title = self._validate_title(title)
         priority = self._validate_priority(priority)
         status = self._validate_status(status)
-        
+
         # Validate tags
         if tags:
-            tags = [tag.strip() for tag in tags if tag.strip()]
-        
+            tags = self._clean_tags(tags)
+
         task = Task(
-            title=title.strip(),
+            title=title,
             description=description.strip(),
             priority=priority,
             status=status,
@@ -115,7 +272,8 @@ class TaskManager:
         )
         
         self.tasks[task.id] = task
-        self._auto_save()
+        self._index_task(task)
+        self._auto_save(task)
         return task
     
     def get_task(self, task_id: str) -> Task:
@@ -132,8 +290,20 @@ class TaskManager:
             TaskNotFoundError: If task not found
         """
         return self._find_task(task_id)
-    
-    def list_tasks(self, 
+
+    def get_tasks_by_title(self, title: str) -> List[Task]:
+        """
+        Get all tasks with an exact title, via the title index.
+
+        Args:
+            title: Exact task title to look up
+
+        Returns:
+            List of tasks bearing that title (possibly empty)
+        """
+        return [self.tasks[tid] for tid in self._by_title.get(title, ())]
+
+    def list_tasks(self,
                   status: Optional[Union[str, TaskStatus]] = None,
                   priority: Optional[Union[str, TaskPriority]] = None,
                   statuses: Optional[List[Union[str, TaskStatus]]] = None,
@@ -158,34 +328,45 @@ class TaskManager:
         Returns:
             List of tasks matching criteria
         """
-        tasks = list(self.tasks.values())
-        
-        # Build filter
-        task_filter = TaskFilter()
-        
-        # Handle backward compatibility
-        if status is not None:
-            task_filter.with_statuses([status])
-        elif statuses:
-            task_filter.with_statuses(statuses)
-        
-        if priority is not None:
-            task_filter.with_priorities([priority])
-        elif priorities:
-            task_filter.with_priorities(priorities)
-        
-        if tags:
-            task_filter.with_tags(tags)
-        
+        # Normalize single-value arguments (backward compatibility)
+        status_list = [status] if status is not None else list(statuses or [])
+        priority_list = [priority] if priority is not None else list(priorities or [])
+
         if preset:
-            task_filter.with_preset(preset)
-        
-        # Apply filters
-        tasks = task_filter.apply(tasks)
-        
+            # Presets can be date-dependent, so build the filter fresh
+            task_filter = (TaskFilter()
+                           .with_statuses(status_list)
+                           .with_priorities(priority_list)
+                           .with_tags(list(tags or []))
+                           .with_preset(preset))
+            if 'overdue' in task_filter.criteria:
+                # Pre-screen through the due index; the filter still
+                # evaluates any remaining criteria over the slice
+                tasks = task_filter.apply(self._overdue_candidates())
+            else:
+                tasks = task_filter.apply(self.tasks.values())
+        else:
+            task_filter = _compile_filter(
+                tuple(status_list), tuple(priority_list), tuple(tags or ())
+            )
+            criteria = task_filter.criteria
+            candidates = self._bucket_candidates(criteria)
+            if set(criteria) <= self._INDEXED_CRITERIA:
+                # Fully indexed: the bucket intersection is the exact answer
+                if candidates is None:
+                    tasks = list(self.tasks.values())
+                else:
+                    tasks = [self.tasks[tid] for tid in candidates]
+            elif candidates is not None:
+                # Partially indexed: pre-screen through the buckets, then
+                # let the filter evaluate the remaining criteria
+                tasks = task_filter.apply(self.tasks[tid] for tid in candidates)
+            else:
+                tasks = task_filter.apply(self.tasks.values())
+
         # Sort results
         tasks = TaskSorter.sort(tasks, sort_by, sort_order)
-        
+
         return tasks
     
     def update_task(self, task_id: str, **kwargs) -> Task:
@@ -207,8 +388,7 @@ class TaskManager:
         
         # Validate updates
         if 'title' in kwargs:
-            self._validate_title(kwargs['title'])
-            kwargs['title'] = kwargs['title'].strip()
+            kwargs['title'] = self._validate_title(kwargs['title'])
         
         if 'description' in kwargs:
             kwargs['description'] = kwargs['description'].strip()
@@ -220,11 +400,13 @@ class TaskManager:
             kwargs['status'] = self._validate_status(kwargs['status'])
         
         if 'tags' in kwargs and kwargs['tags']:
-            kwargs['tags'] = [tag.strip() for tag in kwargs['tags'] if tag.strip()]
+            kwargs['tags'] = self._clean_tags(kwargs['tags'])
         
-        # Apply updates
+        # Apply updates, keeping the lookup indexes in sync
+        self._unindex_task(task)
         task.update(**kwargs)
-        self._auto_save()
+        self._index_task(task)
+        self._auto_save(task)
         
         return task
     
@@ -243,7 +425,8 @@ class TaskManager:
         """
         task = self._find_task(task_id)
         del self.tasks[task.id]
-        self._auto_save()
+        self._unindex_task(task)
+        self._auto_save(task, deleted=True)
         return task
     
     def mark_done(self, task_id: str) -> Task:
@@ -265,23 +448,17 @@ class TaskManager:
         Returns:
             Dictionary with counts by status and priority
         """
-        stats = {
+        # The index buckets already hold the per-status/per-priority ID
+        # sets, so stats reduce to len() calls without touching any Task
+        return {
             'total': len(self.tasks),
-            'by_status': {},
-            'by_priority': {}
+            'by_status': {
+                status.value: len(self._by_status[status]) for status in TaskStatus
+            },
+            'by_priority': {
+                priority.value: len(self._by_priority[priority]) for priority in TaskPriority
+            }
         }
-        
-        # Count by status
-        for status in TaskStatus:
-            count = len([t for t in self.tasks.values() if t.status == status])
-            stats['by_status'][status.value] = count
-        
-        # Count by priority
-        for priority in TaskPriority:
-            count = len([t for t in self.tasks.values() if t.priority == priority])
-            stats['by_priority'][priority.value] = count
-        
-        return stats
     
     def search_tasks(self, 
                     query: str,
@@ -302,8 +479,19 @@ class TaskManager:
         Returns:
             List of matching tasks
         """
-        tasks = list(self.tasks.values())
-        
+        # Single-word case-insensitive queries can be pre-screened through
+        # the inverted index: a word-only substring always falls inside one
+        # token, so only tasks owning a matching token need a full check.
+        if query and not regex and not case_sensitive and re.fullmatch(r"\w+", query):
+            needle = query.casefold()
+            candidate_ids: Set[str] = set()
+            for token, ids in self._token_index.items():
+                if needle in token:
+                    candidate_ids |= ids
+            tasks = [self.tasks[tid] for tid in candidate_ids if tid in self.tasks]
+        else:
+            tasks = self.tasks.values()
+
         # Apply search
         tasks = SearchEngine.search(tasks, query, regex, case_sensitive)
         
@@ -326,10 +514,13 @@ class TaskManager:
         Returns:
             List of matching tasks
         """
-        tasks = list(self.tasks.values())
-        
-        # Apply filter
-        tasks = filter_obj.apply(tasks)
+        # Pre-screen through the index buckets where the criteria allow,
+        # then apply the filter to the surviving candidates only
+        candidates = self._bucket_candidates(filter_obj.criteria)
+        if candidates is not None:
+            tasks = filter_obj.apply(self.tasks[tid] for tid in candidates)
+        else:
+            tasks = filter_obj.apply(self.tasks.values())
         
         # Sort results
         tasks = TaskSorter.sort(tasks, sort_by, sort_order)
@@ -360,6 +551,22 @@ class TaskManager:
         Returns:
             List of tasks within date range
         """
+        if field == 'due_date' and (start_date or end_date):
+            # The due index is sorted, so the range is a bisected slice
+            # instead of a scan; bounds are widened to whole days to match
+            # the filter's date-granularity comparison
+            lo, hi = 0, len(self._due_index)
+            if start_date:
+                start = start_date.date() if isinstance(start_date, datetime) else start_date
+                cutoff = datetime.combine(start, datetime.min.time())
+                lo = bisect.bisect_left(self._due_index, (cutoff,))
+            if end_date:
+                end = end_date.date() if isinstance(end_date, datetime) else end_date
+                cutoff = datetime.combine(end + timedelta(days=1), datetime.min.time())
+                hi = bisect.bisect_left(self._due_index, (cutoff,))
+            tasks = [self.tasks[tid] for _, tid in self._due_index[lo:hi]]
+            return TaskSorter.sort(tasks, SortField.CREATED_AT, SortOrder.DESC)
+
         task_filter = TaskFilter().with_date_range(start_date, end_date, field)
         return self.filter_tasks(task_filter)
     
@@ -371,14 +578,48 @@ class TaskManager:
             self._storage = get_storage()
         return self._storage
     
-    def _auto_save(self) -> None:
-        """Save tasks if auto-save is enabled."""
-        if self.auto_save and self._storage:
+    def __enter__(self) -> "TaskManager":
+        """Suspend autosave for a batch of mutations (flushed on exit)."""
+        self._suspend_autosave += 1
+        if not self._atexit_registered:
+            # Guarantee durability even if the batch never exits cleanly
+            atexit.register(self._flush)
+            self._atexit_registered = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._suspend_autosave -= 1
+        if self._suspend_autosave == 0:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write pending changes to storage, if any."""
+        if self._dirty and self._storage:
             self.storage.save_tasks(self)
-    
+            self._dirty = False
+
+    def _auto_save(self, task: Optional[Task] = None, deleted: bool = False) -> None:
+        """Save tasks if auto-save is enabled (coalesced inside a batch)."""
+        if not (self.auto_save and self._storage):
+            return
+        self._dirty = True
+        if self._suspend_autosave:
+            return
+        if task is not None and getattr(self.storage, 'use_append_log', False):
+            # Log only the changed task instead of rewriting the whole file
+            if deleted:
+                op = {'type': 'delete', 'id': task.id}
+            else:
+                op = {'type': 'upsert', 'task': task.to_dict()}
+            self.storage.append_mutation(self, op)
+            self._dirty = False
+            return
+        self._flush()
+
     def save(self) -> None:
         """Manually save tasks to storage."""
         self.storage.save_tasks(self)
+        self._dirty = False
     
     def load(self) -> None:
         """Load tasks from storage."""
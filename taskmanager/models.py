@@ -24,9 +24,19 @@ class TaskPriority(str, Enum):
     URGENT = "urgent"
 
 
-@dataclass
+# Precomputed value -> member maps; a dict probe is much cheaper than
+# Enum.__call__ with its ValueError path for invalid input
+STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+PRIORITY_BY_VALUE = {priority.value: priority for priority in TaskPriority}
+
+
+@dataclass(slots=True)
 class Task:
-    """Task model representing a single task."""
+    """Task model representing a single task.
+
+    Uses __slots__ to cut per-task memory and speed up attribute access,
+    which matters once thousands of tasks are loaded at once.
+    """
     
     title: str
     description: str = ""
@@ -38,16 +48,23 @@ class Task:
     due_date: Optional[datetime] = None
     tags: List[str] = field(default_factory=list)
     linear_issue_id: Optional[str] = None
-    
+    # Memoized to_dict() result; reset whenever the task mutates
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    # Memoized frozenset of tags for repeated filter membership checks
+    _tag_set: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    # Memoized lowercase searchable text for case-insensitive search
+    _search_blob: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate and convert fields after initialization."""
-        # Ensure status is a TaskStatus enum
+        # Ensure status is a TaskStatus enum; the dict probe handles the
+        # common valid values, Enum.__call__ only runs to raise on bad input
         if isinstance(self.status, str):
-            self.status = TaskStatus(self.status)
-        
+            self.status = STATUS_BY_VALUE.get(self.status) or TaskStatus(self.status)
+
         # Ensure priority is a TaskPriority enum
         if isinstance(self.priority, str):
-            self.priority = TaskPriority(self.priority)
+            self.priority = PRIORITY_BY_VALUE.get(self.priority) or TaskPriority(self.priority)
         
         # Ensure dates are datetime objects
         if isinstance(self.created_at, str):
@@ -60,32 +77,82 @@ class Task:
             self.due_date = datetime.fromisoformat(self.due_date)
     
     def update(self, **kwargs):
-        """Update task fields and set updated_at timestamp."""
+        """Update task fields and set updated_at timestamp.
+
+        No-op assignments are skipped, so the timestamp only moves and the
+        memoized caches only drop when a field actually changed.
+        """
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if hasattr(self, key) and getattr(self, key) != value:
                 setattr(self, key, value)
-        self.updated_at = datetime.now()
-    
+                changed = True
+        if changed:
+            self.updated_at = datetime.now()
+            self._dict_cache = None
+            self._tag_set = None
+            self._search_blob = None
+
     def to_dict(self):
-        """Convert task to dictionary for serialization."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "status": self.status.value,
-            "priority": self.priority.value,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "due_date": self.due_date.isoformat() if self.due_date else None,
-            "tags": self.tags,
-            "linear_issue_id": self.linear_issue_id,
-        }
+        """Convert task to dictionary for serialization.
+
+        The result (including the ISO-formatted dates) is cached until the
+        task is next mutated through update(), so repeated saves don't
+        re-serialize unchanged tasks. Callers must not mutate the dict.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "id": self.id,
+                "title": self.title,
+                "description": self.description,
+                "status": self.status.value,
+                "priority": self.priority.value,
+                "created_at": self.created_at.isoformat(),
+                "updated_at": self.updated_at.isoformat(),
+                "due_date": self.due_date.isoformat() if self.due_date else None,
+                "tags": self.tags,
+                "linear_issue_id": self.linear_issue_id,
+            }
+        return self._dict_cache
     
     @classmethod
     def from_dict(cls, data: dict):
         """Create a Task instance from a dictionary."""
         return cls(**data)
+
+    @classmethod
+    def bulk_create(cls, specs: List[dict]) -> List["Task"]:
+        """Create many tasks in one batch.
+
+        The whole batch shares a single datetime.now() result, so N tasks
+        cost one clock read instead of 2N. Specs may still override the
+        timestamps (or any other field) explicitly.
+        """
+        now = datetime.now()
+        defaults = {"created_at": now, "updated_at": now}
+        return [cls(**{**defaults, **spec}) for spec in specs]
     
+    @property
+    def search_blob(self):
+        """Casefolded searchable text, cached until the next update.
+
+        Fields are joined with NUL so a query can never match across a
+        field boundary. casefold() rather than lower() so caseless
+        matching also covers non-ASCII (e.g. German ß vs ss). None fields
+        are skipped, matching the per-field search's tolerance.
+        """
+        if self._search_blob is None:
+            parts = [self.title, self.description, self.id, *(self.tags or ())]
+            self._search_blob = "\0".join(p for p in parts if p).casefold()
+        return self._search_blob
+
+    @property
+    def tag_set(self):
+        """Tags as a frozenset, cached until the task is next updated."""
+        if self._tag_set is None:
+            self._tag_set = frozenset(self.tags)
+        return self._tag_set
+
     @property
     def short_id(self):
         """Return the first 6 characters of the ID for display."""
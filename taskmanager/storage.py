@@ -3,13 +3,65 @@ JSON storage backend for task persistence.
 """
 
 import json
+import mmap
 import os
-import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TYPE_CHECKING
 from .models import Task
-from .manager import TaskManager
+
+if TYPE_CHECKING:
+    from .manager import TaskManager
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize to indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+_TASK_KEYS = frozenset({"id", "title", "status", "priority", "created_at"})
+
+
+def _task_object_hook(obj: dict):
+    """Turn task-shaped dicts into Task objects while the parser runs."""
+    if _TASK_KEYS <= obj.keys():
+        return Task.from_dict(obj)
+    return obj
+
+
+def _loads(raw: bytes, object_hook=None) -> dict:
+    """Parse JSON bytes (orjson when available).
+
+    orjson has no object_hook support, so hook-based construction only
+    applies on the stdlib path; orjson callers convert after parsing.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw, object_hook=object_hook)
+
+
+def _serialize_chunk(tasks: List[Task]) -> List[dict]:
+    """Serialize a chunk of tasks (module-level so it pickles to workers)."""
+    return [task.to_dict() for task in tasks]
+
+
+def _dumps_compact(data: dict) -> bytes:
+    """Serialize to compact single-line JSON bytes (for the op log)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
 
 
 class StorageError(Exception):
@@ -24,8 +76,16 @@ class JSONStorage:
     
     DEFAULT_DATA_DIR = Path.home() / ".taskmanager"
     TASKS_FILE = "tasks.json"
+    MSGPACK_FILE = "tasks.msgpack"
+    LOG_FILE = "tasks.log"
     BACKUP_EXTENSION = ".backup"
     CURRENT_VERSION = "1.0.0"
+    # Compact the op log once it outgrows the snapshot (or this floor)
+    MIN_COMPACT_SIZE = 4096
+    # Below this task count, process-pool serialization costs more than it saves
+    PARALLEL_EXPORT_THRESHOLD = 5000
+    # Snapshots this large are memory-mapped instead of read into a bytes copy
+    MMAP_THRESHOLD = 1024 * 1024
     
     def __init__(self, data_dir: Optional[Path] = None):
         """
@@ -41,8 +101,24 @@ class JSONStorage:
         else:
             self.data_dir = data_dir or self.DEFAULT_DATA_DIR
         
-        self.tasks_file = self.data_dir / self.TASKS_FILE
-        self.backup_file = self.data_dir / f"{self.TASKS_FILE}{self.BACKUP_EXTENSION}"
+        # Opt-in binary snapshot format: skips JSON encode/escape entirely
+        # for large stores (requires the msgpack package)
+        requested_format = os.getenv("TASKMANAGER_FORMAT", "json").lower()
+        if requested_format == "msgpack" and msgpack is None:
+            # Falling back silently would write tasks.json now and read
+            # tasks.msgpack once the package appears, "losing" the tasks
+            raise StorageError(
+                "TASKMANAGER_FORMAT=msgpack requires the msgpack package; "
+                "install it or unset TASKMANAGER_FORMAT"
+            )
+        self.use_msgpack = requested_format == "msgpack"
+
+        snapshot_name = self.MSGPACK_FILE if self.use_msgpack else self.TASKS_FILE
+        self.tasks_file = self.data_dir / snapshot_name
+        self.backup_file = self.data_dir / f"{snapshot_name}{self.BACKUP_EXTENSION}"
+        self.log_file = self.data_dir / self.LOG_FILE
+        # Opt-in append-log mode: O(1) I/O per mutation instead of O(N)
+        self.use_append_log = os.getenv("TASKMANAGER_APPEND_LOG", "").lower() in ("1", "true", "yes")
         
         # Ensure data directory exists
         self._ensure_data_dir()
@@ -55,39 +131,72 @@ class JSONStorage:
             raise StorageError(f"Failed to create data directory: {e}")
     
     def _create_backup(self) -> None:
-        """Create a backup of the current tasks file."""
+        """Rotate the current tasks file into the backup slot.
+
+        Uses a rename instead of copying the whole file, so backups cost
+        O(1) regardless of store size.
+        """
         if self.tasks_file.exists():
             try:
-                shutil.copy2(self.tasks_file, self.backup_file)
+                os.replace(self.tasks_file, self.backup_file)
             except Exception as e:
                 raise StorageError(f"Failed to create backup: {e}")
-    
+
     def _restore_backup(self) -> None:
         """Restore tasks from backup file."""
         if self.backup_file.exists():
             try:
-                shutil.copy2(self.backup_file, self.tasks_file)
+                os.replace(self.backup_file, self.tasks_file)
             except Exception as e:
                 raise StorageError(f"Failed to restore backup: {e}")
     
+    def _encode_snapshot(self, data: dict) -> bytes:
+        """Encode a snapshot in the configured on-disk format."""
+        if self.use_msgpack:
+            return msgpack.packb(data, use_bin_type=True)
+        return _dumps(data)
+
+    def _decode_snapshot(self, raw: bytes) -> dict:
+        """Decode a snapshot in the configured on-disk format."""
+        if self.use_msgpack:
+            return msgpack.unpackb(raw, raw=False)
+        return _loads(raw, object_hook=_task_object_hook)
+
     def _serialize_task(self, task: Task) -> dict:
         """Convert a Task object to a JSON-serializable dict."""
         return task.to_dict()
     
-    def _deserialize_task(self, data: dict) -> Task:
-        """Convert a dict to a Task object."""
+    def _deserialize_task(self, data) -> Task:
+        """Convert a dict to a Task object (no-op if already converted)."""
+        if isinstance(data, Task):
+            return data
         return Task.from_dict(data)
+
+    def _serialize_all(self, tasks) -> List[dict]:
+        """Serialize tasks, fanning out to worker processes for huge exports."""
+        tasks = list(tasks)
+        if len(tasks) >= self.PARALLEL_EXPORT_THRESHOLD:
+            try:
+                from concurrent.futures import ProcessPoolExecutor
+
+                workers = os.cpu_count() or 1
+                chunk_size = -(-len(tasks) // workers)  # ceil division
+                chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return [d for part in pool.map(_serialize_chunk, chunks) for d in part]
+            except Exception:
+                # Worker pools can fail in restricted environments; the
+                # serial path is always correct
+                pass
+        return [self._serialize_task(task) for task in tasks]
     
-    def save_tasks(self, task_manager: TaskManager) -> None:
+    def save_tasks(self, task_manager: "TaskManager") -> None:
         """
         Save all tasks to JSON file with atomic write.
         
         Args:
             task_manager: TaskManager instance containing tasks
         """
-        # Create backup before saving
-        self._create_backup()
-        
         # Prepare data structure
         data = {
             "version": self.CURRENT_VERSION,
@@ -100,56 +209,143 @@ class JSONStorage:
         
         # Write to temporary file first (atomic write)
         temp_file = self.tasks_file.with_suffix('.tmp')
-        
+        rotated = False
+
         try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
+            with open(temp_file, 'wb') as f:
+                f.write(self._encode_snapshot(data))
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Rotate the previous snapshot into the backup slot only after
+            # the new snapshot is safely on disk
+            if self.tasks_file.exists():
+                self._create_backup()
+                rotated = True
+
             # Atomic rename
-            temp_file.replace(self.tasks_file)
-            
+            os.replace(temp_file, self.tasks_file)
+
+            # A full snapshot supersedes any pending op log
+            if self.log_file.exists():
+                self.log_file.unlink()
+
         except Exception as e:
-            # Restore from backup on failure
             if temp_file.exists():
                 temp_file.unlink()
-            self._restore_backup()
+            # Undo the rotation on failure; an older backup is left alone
+            if rotated:
+                self._restore_backup()
             raise StorageError(f"Failed to save tasks: {e}")
-    
-    def load_tasks(self, task_manager: TaskManager) -> None:
+
+    def append_mutation(self, task_manager: "TaskManager", op: dict) -> None:
+        """
+        Append a single mutation to the op log instead of rewriting the file.
+
+        Args:
+            task_manager: TaskManager instance (used when compacting)
+            op: Operation record, e.g. {'type': 'upsert', 'task': {...}}
+                or {'type': 'delete', 'id': ...}
+        """
+        try:
+            with open(self.log_file, 'ab') as f:
+                f.write(_dumps_compact(op) + b'\n')
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            raise StorageError(f"Failed to append to task log: {e}")
+
+        # Compact once the log outgrows the snapshot
+        snapshot_size = self.tasks_file.stat().st_size if self.tasks_file.exists() else 0
+        if self.log_file.stat().st_size > max(snapshot_size, self.MIN_COMPACT_SIZE):
+            self.save_tasks(task_manager)
+
+    def _replay_log(self, task_manager: "TaskManager") -> None:
+        """Replay op-log entries on top of the loaded snapshot."""
+        if not self.log_file.exists():
+            return
+
+        with open(self.log_file, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                op = _loads(line)
+                if op.get('type') == 'delete':
+                    task_manager.tasks.pop(op.get('id'), None)
+                elif op.get('type') == 'upsert':
+                    task = self._deserialize_task(op['task'])
+                    task_manager.tasks[task.id] = task
+
+    def _read_snapshot(self) -> dict:
+        """Read and decode the snapshot file.
+
+        Large JSON snapshots are memory-mapped and handed to the parser as
+        a zero-copy memoryview (orjson accepts buffers directly), avoiding
+        a full read() copy of the file. Small files and msgpack snapshots
+        use the plain read path.
+        """
+        if (orjson is not None and not self.use_msgpack
+                and self.tasks_file.stat().st_size > self.MMAP_THRESHOLD):
+            with open(self.tasks_file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        return orjson.loads(view)
+                    finally:
+                        # The view must be released before the mmap closes
+                        view.release()
+
+        with open(self.tasks_file, 'rb') as f:
+            return self._decode_snapshot(f.read())
+
+    def load_tasks(self, task_manager: "TaskManager") -> None:
         """
         Load tasks from JSON file into TaskManager.
-        
+
         Args:
             task_manager: TaskManager instance to populate
         """
-        if not self.tasks_file.exists():
+        if not self.tasks_file.exists() and self.backup_file.exists():
+            # A save was interrupted between rotation and rename; the
+            # backup holds the last complete snapshot
+            self._restore_backup()
+
+        if not self.tasks_file.exists() and not self.log_file.exists():
             # No tasks file yet, start with empty manager
             return
-        
+
         try:
-            with open(self.tasks_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            data = {}
+            if self.tasks_file.exists():
+                data = self._read_snapshot()
+
             # Check version for future migration support
             version = data.get('version', '0.1.0')
             if version != self.CURRENT_VERSION:
                 # In the future, handle migrations here
                 pass
-            
-            # Clear existing tasks
-            task_manager.tasks.clear()
-            
-            # Load tasks
-            for task_data in data.get('tasks', []):
-                task = self._deserialize_task(task_data)
-                task_manager.tasks[task.id] = task
-                
-        except json.JSONDecodeError as e:
+
+            # Build the task table in one comprehension; CPython sizes the
+            # dict up front instead of rehashing as it grows
+            task_manager.tasks = {
+                task.id: task
+                for task in map(self._deserialize_task, data.get('tasks', []))
+            }
+
+            # Apply any mutations logged since the last snapshot
+            self._replay_log(task_manager)
+
+            # Rebuild lookup indexes after bulk load
+            task_manager.reindex()
+
+        except ValueError as e:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
             raise StorageError(f"Invalid JSON in tasks file: {e}")
         except Exception as e:
             raise StorageError(f"Failed to load tasks: {e}")
     
-    def export_tasks(self, task_manager: TaskManager, export_file: Path) -> None:
+    def export_tasks(self, task_manager: "TaskManager", export_file: Path) -> None:
         """
         Export tasks to a specified file.
         
@@ -160,7 +356,7 @@ class JSONStorage:
         data = {
             "version": self.CURRENT_VERSION,
             "exported_at": datetime.now().isoformat(),
-            "tasks": [self._serialize_task(task) for task in task_manager.tasks.values()],
+            "tasks": self._serialize_all(task_manager.tasks.values()),
             "metadata": {
                 "task_count": len(task_manager.tasks),
                 "export_source": str(self.tasks_file)
@@ -168,12 +364,12 @@ class JSONStorage:
         }
         
         try:
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(export_file, 'wb') as f:
+                f.write(_dumps(data))
         except Exception as e:
             raise StorageError(f"Failed to export tasks: {e}")
     
-    def import_tasks(self, task_manager: TaskManager, import_file: Path, 
+    def import_tasks(self, task_manager: "TaskManager", import_file: Path, 
                      merge: bool = False) -> int:
         """
         Import tasks from a file.
@@ -187,23 +383,28 @@ class JSONStorage:
             Number of tasks imported
         """
         try:
-            with open(import_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if not merge:
-                task_manager.tasks.clear()
-            
-            count = 0
-            for task_data in data.get('tasks', []):
-                task = self._deserialize_task(task_data)
-                # Only add if not already present (when merging)
-                if task.id not in task_manager.tasks:
-                    task_manager.tasks[task.id] = task
-                    count += 1
-            
-            return count
+            with open(import_file, 'rb') as f:
+                data = _loads(f.read(), object_hook=_task_object_hook)
+
+            imported = {
+                task.id: task
+                for task in map(self._deserialize_task, data.get('tasks', []))
+            }
+
+            if merge:
+                # Only add tasks not already present, in one bulk update
+                imported = {
+                    tid: task for tid, task in imported.items()
+                    if tid not in task_manager.tasks
+                }
+                task_manager.tasks.update(imported)
+            else:
+                task_manager.tasks = imported
+
+            task_manager.reindex()
+            return len(imported)
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise StorageError(f"Invalid JSON in import file: {e}")
         except Exception as e:
             raise StorageError(f"Failed to import tasks: {e}")
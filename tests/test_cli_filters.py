@@ -9,14 +9,15 @@ from taskmanager.models import TaskStatus, TaskPriority
 from datetime import datetime, timedelta
 
 
+@pytest.fixture(scope="module")
+def runner():
+    """Create a CLI test runner (stateless, shared across the module)."""
+    return CliRunner()
+
+
 class TestCLIFiltering:
     """Test CLI filtering commands."""
     
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
-    
     def test_list_with_multiple_statuses(self, runner):
         """Test list command with multiple status filters."""
         # First create some tasks
@@ -10,93 +10,96 @@ from taskmanager.filters import (
     SortField, SortOrder, FilterPreset
 )
 
+# One clock read for the whole module; every relative date derives from it
+_NOW = datetime.now()
+
+
+@pytest.fixture(scope="module")
+def status_tasks():
+    """Three tasks, one per status, shared by the read-only status tests."""
+    return [
+        Task(title="Task 1", status=TaskStatus.TODO),
+        Task(title="Task 2", status=TaskStatus.IN_PROGRESS),
+        Task(title="Task 3", status=TaskStatus.DONE),
+    ]
+
+
+@pytest.fixture(scope="module")
+def priority_tasks():
+    """Three tasks of varying priority, shared by the priority tests."""
+    return [
+        Task(title="Task 1", priority=TaskPriority.LOW),
+        Task(title="Task 2", priority=TaskPriority.HIGH),
+        Task(title="Task 3", priority=TaskPriority.URGENT),
+    ]
+
 
 class TestTaskFilter:
     """Test the TaskFilter class."""
     
-    def test_filter_by_single_status(self):
-        """Test filtering by a single status."""
-        tasks = [
-            Task(title="Task 1", status=TaskStatus.TODO),
-            Task(title="Task 2", status=TaskStatus.IN_PROGRESS),
-            Task(title="Task 3", status=TaskStatus.DONE),
-        ]
-        
-        filter_obj = TaskFilter().with_statuses([TaskStatus.TODO])
-        result = filter_obj.apply(tasks)
-        
-        assert len(result) == 1
-        assert result[0].title == "Task 1"
-    
-    def test_filter_by_multiple_statuses(self):
-        """Test filtering by multiple statuses."""
-        tasks = [
-            Task(title="Task 1", status=TaskStatus.TODO),
-            Task(title="Task 2", status=TaskStatus.IN_PROGRESS),
-            Task(title="Task 3", status=TaskStatus.DONE),
-        ]
-        
-        filter_obj = TaskFilter().with_statuses([TaskStatus.TODO, TaskStatus.IN_PROGRESS])
-        result = filter_obj.apply(tasks)
-        
-        assert len(result) == 2
-        assert {t.title for t in result} == {"Task 1", "Task 2"}
-    
-    def test_filter_by_priorities(self):
+    @pytest.mark.parametrize("statuses,expected", [
+        ([TaskStatus.TODO], ["Task 1"]),
+        ([TaskStatus.TODO, TaskStatus.IN_PROGRESS], ["Task 1", "Task 2"]),
+    ])
+    def test_filter_by_statuses(self, status_tasks, statuses, expected):
+        """Test filtering by one or more statuses."""
+        filter_obj = TaskFilter().with_statuses(statuses)
+        result = filter_obj.apply(status_tasks)
+
+        assert sorted(t.title for t in result) == expected
+
+    @pytest.mark.parametrize("priorities,expected", [
+        ([TaskPriority.HIGH, TaskPriority.URGENT], ["Task 2", "Task 3"]),
+        ([TaskPriority.LOW], ["Task 1"]),
+    ])
+    def test_filter_by_priorities(self, priority_tasks, priorities, expected):
         """Test filtering by priorities."""
-        tasks = [
-            Task(title="Task 1", priority=TaskPriority.LOW),
-            Task(title="Task 2", priority=TaskPriority.HIGH),
-            Task(title="Task 3", priority=TaskPriority.URGENT),
-        ]
-        
-        filter_obj = TaskFilter().with_priorities([TaskPriority.HIGH, TaskPriority.URGENT])
-        result = filter_obj.apply(tasks)
-        
-        assert len(result) == 2
-        assert {t.title for t in result} == {"Task 2", "Task 3"}
+        filter_obj = TaskFilter().with_priorities(priorities)
+        result = filter_obj.apply(priority_tasks)
+
+        assert sorted(t.title for t in result) == expected
     
     def test_filter_by_tags_match_any(self):
         """Test filtering by tags (match any)."""
-        tasks = [
+        tasks = (
             Task(title="Task 1", tags=["work", "urgent"]),
             Task(title="Task 2", tags=["personal"]),
             Task(title="Task 3", tags=["work", "meeting"]),
-        ]
+        )
         
         filter_obj = TaskFilter().with_tags(["work"], match_all=False)
         result = filter_obj.apply(tasks)
         
         assert len(result) == 2
-        assert {t.title for t in result} == {"Task 1", "Task 3"}
+        assert sorted(t.title for t in result) == ["Task 1", "Task 3"]
     
     def test_filter_by_tags_match_all(self):
         """Test filtering by tags (match all)."""
-        tasks = [
+        tasks = (
             Task(title="Task 1", tags=["work", "urgent", "bug"]),
             Task(title="Task 2", tags=["work", "urgent"]),
             Task(title="Task 3", tags=["work"]),
-        ]
+        )
         
         filter_obj = TaskFilter().with_tags(["work", "urgent"], match_all=True)
         result = filter_obj.apply(tasks)
         
         assert len(result) == 2
-        assert {t.title for t in result} == {"Task 1", "Task 2"}
+        assert sorted(t.title for t in result) == ["Task 1", "Task 2"]
     
     def test_filter_by_date_range(self):
         """Test filtering by date range."""
-        today = datetime.now()
+        today = _NOW
         yesterday = today - timedelta(days=1)
         tomorrow = today + timedelta(days=1)
         next_week = today + timedelta(days=7)
         
-        tasks = [
+        tasks = (
             Task(title="Task 1", due_date=yesterday),
             Task(title="Task 2", due_date=today),
             Task(title="Task 3", due_date=tomorrow),
             Task(title="Task 4", due_date=next_week),
-        ]
+        )
         
         filter_obj = TaskFilter().with_date_range(
             start_date=today.date(),
@@ -105,46 +108,40 @@ class TestTaskFilter:
         result = filter_obj.apply(tasks)
         
         assert len(result) == 2
-        assert {t.title for t in result} == {"Task 2", "Task 3"}
+        assert sorted(t.title for t in result) == ["Task 2", "Task 3"]
     
     def test_filter_with_search_query(self):
         """Test filtering with search query."""
-        tasks = [
+        tasks = (
             Task(title="Fix bug in login", description="Critical issue"),
             Task(title="Add feature", description="New dashboard"),
             Task(title="Update docs", description="Fix typos"),
-        ]
+        )
         
         filter_obj = TaskFilter().with_search_query("fix")
         result = filter_obj.apply(tasks)
         
         assert len(result) == 2
-        assert {t.title for t in result} == {"Fix bug in login", "Update docs"}
+        assert sorted(t.title for t in result) == ["Fix bug in login", "Update docs"]
     
-    def test_filter_preset_active(self):
+    def test_filter_preset_active(self, status_tasks):
         """Test the ACTIVE preset."""
-        tasks = [
-            Task(title="Task 1", status=TaskStatus.TODO),
-            Task(title="Task 2", status=TaskStatus.IN_PROGRESS),
-            Task(title="Task 3", status=TaskStatus.DONE),
-        ]
-        
         filter_obj = TaskFilter().with_preset(FilterPreset.ACTIVE)
-        result = filter_obj.apply(tasks)
-        
+        result = filter_obj.apply(status_tasks)
+
         assert len(result) == 2
-        assert {t.title for t in result} == {"Task 1", "Task 2"}
+        assert sorted(t.title for t in result) == ["Task 1", "Task 2"]
     
     def test_filter_preset_overdue(self):
         """Test the OVERDUE preset."""
-        yesterday = datetime.now() - timedelta(days=1)
-        tomorrow = datetime.now() + timedelta(days=1)
+        yesterday = _NOW - timedelta(days=1)
+        tomorrow = _NOW + timedelta(days=1)
         
-        tasks = [
+        tasks = (
             Task(title="Task 1", due_date=yesterday, status=TaskStatus.TODO),
             Task(title="Task 2", due_date=yesterday, status=TaskStatus.DONE),
             Task(title="Task 3", due_date=tomorrow, status=TaskStatus.TODO),
-        ]
+        )
         
         filter_obj = TaskFilter().with_preset(FilterPreset.OVERDUE)
         result = filter_obj.apply(tasks)
@@ -152,29 +149,22 @@ class TestTaskFilter:
         assert len(result) == 1
         assert result[0].title == "Task 1"
     
-    def test_filter_preset_high_priority(self):
+    def test_filter_preset_high_priority(self, priority_tasks):
         """Test the HIGH_PRIORITY preset."""
-        tasks = [
-            Task(title="Task 1", priority=TaskPriority.LOW),
-            Task(title="Task 2", priority=TaskPriority.HIGH),
-            Task(title="Task 3", priority=TaskPriority.URGENT),
-        ]
-        
         filter_obj = TaskFilter().with_preset(FilterPreset.HIGH_PRIORITY)
-        result = filter_obj.apply(tasks)
-        
+        result = filter_obj.apply(priority_tasks)
+
         assert len(result) == 2
-        assert {t.title for t in result} == {"Task 2", "Task 3"}
+        assert sorted(t.title for t in result) == ["Task 2", "Task 3"]
     
     def test_combined_filters(self):
         """Test combining multiple filters."""
-        today = datetime.now()
-        tasks = [
+        tasks = (
             Task(title="Task 1", status=TaskStatus.TODO, priority=TaskPriority.HIGH, tags=["work"]),
             Task(title="Task 2", status=TaskStatus.TODO, priority=TaskPriority.LOW, tags=["work"]),
             Task(title="Task 3", status=TaskStatus.DONE, priority=TaskPriority.HIGH, tags=["work"]),
             Task(title="Task 4", status=TaskStatus.TODO, priority=TaskPriority.HIGH, tags=["personal"]),
-        ]
+        )
         
         filter_obj = (TaskFilter()
                      .with_statuses([TaskStatus.TODO])
@@ -196,11 +186,11 @@ class TestTaskSorter:
         task3 = Task(title="Task 3")
         
         # Manually adjust created_at for testing
-        task1.created_at = datetime.now() - timedelta(days=2)
-        task2.created_at = datetime.now() - timedelta(days=1)
-        task3.created_at = datetime.now()
+        task1.created_at = _NOW - timedelta(days=2)
+        task2.created_at = _NOW - timedelta(days=1)
+        task3.created_at = _NOW
         
-        tasks = [task2, task3, task1]
+        tasks = (task2, task3, task1)
         
         # Sort ascending
         result = TaskSorter.sort(tasks, SortField.CREATED_AT, SortOrder.ASC)
@@ -212,11 +202,11 @@ class TestTaskSorter:
     
     def test_sort_by_priority(self):
         """Test sorting by priority."""
-        tasks = [
+        tasks = (
             Task(title="Task 1", priority=TaskPriority.MEDIUM),
             Task(title="Task 2", priority=TaskPriority.URGENT),
             Task(title="Task 3", priority=TaskPriority.LOW),
-        ]
+        )
         
         result = TaskSorter.sort(tasks, SortField.PRIORITY, SortOrder.ASC)
         priorities = [t.priority for t in result]
@@ -224,23 +214,23 @@ class TestTaskSorter:
     
     def test_sort_by_due_date(self):
         """Test sorting by due date."""
-        today = datetime.now()
-        tasks = [
+        today = _NOW
+        tasks = (
             Task(title="Task 1", due_date=today + timedelta(days=2)),
             Task(title="Task 2"),  # No due date
             Task(title="Task 3", due_date=today + timedelta(days=1)),
-        ]
+        )
         
         result = TaskSorter.sort(tasks, SortField.DUE_DATE, SortOrder.ASC)
         assert [t.title for t in result] == ["Task 3", "Task 1", "Task 2"]
     
     def test_sort_by_title(self):
         """Test sorting by title."""
-        tasks = [
+        tasks = (
             Task(title="Zebra task"),
             Task(title="Alpha task"),
             Task(title="Beta task"),
-        ]
+        )
         
         result = TaskSorter.sort(tasks, SortField.TITLE, SortOrder.ASC)
         assert [t.title for t in result] == ["Alpha task", "Beta task", "Zebra task"]
@@ -251,23 +241,23 @@ class TestSearchEngine:
     
     def test_basic_search(self):
         """Test basic text search."""
-        tasks = [
+        tasks = (
             Task(title="Fix login bug", description="User cannot log in"),
             Task(title="Add logout feature", description="Related to login system"),
             Task(title="Update user profile", description=""),
-        ]
+        )
         
         result = SearchEngine.search(tasks, "login")
         assert len(result) == 2
-        assert {t.title for t in result} == {"Fix login bug", "Add logout feature"}
+        assert sorted(t.title for t in result) == ["Add logout feature", "Fix login bug"]
     
     def test_case_sensitive_search(self):
         """Test case-sensitive search."""
-        tasks = [
+        tasks = (
             Task(title="Fix LOGIN bug"),
             Task(title="Fix login bug"),
             Task(title="LOGIN feature"),
-        ]
+        )
         
         # Case-insensitive (default)
         result = SearchEngine.search(tasks, "login", case_sensitive=False)
@@ -280,31 +270,42 @@ class TestSearchEngine:
     
     def test_regex_search(self):
         """Test regex pattern search."""
-        tasks = [
+        tasks = (
             Task(title="Task-123", description=""),
             Task(title="Task-456", description=""),
             Task(title="Feature-789", description=""),
-        ]
+        )
         
         result = SearchEngine.search(tasks, r"Task-\d+", regex=True)
         assert len(result) == 2
-        assert {t.title for t in result} == {"Task-123", "Task-456"}
+        assert sorted(t.title for t in result) == ["Task-123", "Task-456"]
     
     def test_search_in_tags(self):
         """Test searching in tags."""
-        tasks = [
+        tasks = (
             Task(title="Task 1", tags=["urgent", "bug"]),
             Task(title="Task 2", tags=["feature"]),
             Task(title="Task 3", tags=["bug", "low-priority"]),
-        ]
+        )
         
         result = SearchEngine.search(tasks, "bug")
         assert len(result) == 2
-        assert {t.title for t in result} == {"Task 1", "Task 3"}
+        assert sorted(t.title for t in result) == ["Task 1", "Task 3"]
     
+    def test_search_with_null_fields(self):
+        """Test that tasks with null optional fields still match."""
+        tasks = (
+            Task(title="Fix login bug", description=None),
+            Task(title="Other task", description=None),
+        )
+
+        result = SearchEngine.search(tasks, "login")
+        assert len(result) == 1
+        assert result[0].title == "Fix login bug"
+
     def test_invalid_regex(self):
         """Test invalid regex pattern handling."""
-        tasks = [Task(title="Task 1")]
+        tasks = (Task(title="Task 1"),)
         
         # Invalid regex should return empty list
         result = SearchEngine.search(tasks, "[invalid(", regex=True)
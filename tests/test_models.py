@@ -107,6 +107,20 @@ class TestTask:
         assert task.tags == ["imported"]
         assert task.linear_issue_id == "LIN-456"
     
+    def test_bulk_create(self):
+        """Test batch task creation."""
+        tasks = Task.bulk_create([
+            {"title": "Task 1"},
+            {"title": "Task 2", "priority": "high", "tags": ["work"]},
+        ])
+
+        assert len(tasks) == 2
+        assert tasks[0].title == "Task 1"
+        assert tasks[1].priority == TaskPriority.HIGH
+        assert tasks[1].tags == ["work"]
+        assert tasks[0].id != tasks[1].id
+        assert tasks[0].created_at == tasks[1].created_at
+
     def test_short_id(self):
         """Test short ID property."""
         task = Task(title="Test", id="abcdef123456")
@@ -0,0 +1,45 @@
+"""
+Tests for CLI utility helpers.
+"""
+
+from taskmanager.models import Task, TaskStatus, TaskPriority
+from taskmanager import utils
+from taskmanager.utils import (
+    format_task_summary, format_task_summaries, select_from_list
+)
+
+
+class TestTaskSummaries:
+    """Test cases for task summary formatting."""
+
+    def test_batched_matches_per_item(self):
+        """Test the batched formatter matches format_task_summary per item."""
+        tasks = [
+            Task(title="Task 1", status=TaskStatus.TODO, priority=TaskPriority.LOW),
+            Task(title="Task 2", status=TaskStatus.IN_PROGRESS, priority=TaskPriority.HIGH,
+                 tags=["work"]),
+            Task(title="A very long task title that should be truncated for display purposes",
+                 status=TaskStatus.DONE, priority=TaskPriority.URGENT),
+        ]
+
+        assert format_task_summaries(tasks) == [format_task_summary(t) for t in tasks]
+
+    def test_select_from_list_with_task_formatter(self, monkeypatch):
+        """Test selecting a task through the batched display path."""
+        tasks = [Task(title="Task 1"), Task(title="Task 2")]
+        monkeypatch.setattr(utils.IntPrompt, "ask", lambda *args, **kwargs: 2)
+
+        selected = select_from_list(tasks, "Select a task", format_task_summary)
+
+        assert selected is tasks[1]
+
+    def test_select_from_list_cancel(self, monkeypatch):
+        """Test cancelling a selection returns None."""
+        tasks = [Task(title="Task 1")]
+        monkeypatch.setattr(utils.IntPrompt, "ask", lambda *args, **kwargs: 0)
+
+        assert select_from_list(tasks, "Select a task", format_task_summary) is None
+
+    def test_select_from_empty_list(self):
+        """Test selecting from an empty list returns None."""
+        assert select_from_list([], "Select a task") is None